@@ -1,4 +1,6 @@
-from typing import List, Dict
+from typing import List, Dict, Type
+
+import numpy as np
 
 from igp2.agents.agent import Agent
 from igp2.core.goal import Goal
@@ -20,6 +22,7 @@ class MacroAgent(Agent):
         self._vehicle = KinematicVehicle(initial_state, self.metadata, fps)
         self._current_macro = None
         self._maneuver_end_idx = []
+        self._done_cache = None
 
     @property
     def current_macro(self) -> MacroAction:
@@ -34,7 +37,18 @@ class MacroAgent(Agent):
     def done(self, observation: Observation) -> bool:
         """ Returns true if the current macro action has reached a completion state. """
         assert self._current_macro is not None, f"Macro action of Agent {self.agent_id} is None!"
-        return self._current_macro.done(observation)
+        return self._macro_done(observation)
+
+    def _macro_done(self, observation: Observation) -> bool:
+        """ Completion check of the current macro action. The result is cached per observation and
+        macro action, since the simulation loop and next_action both query it within one tick and
+        the check re-walks the maneuver trajectory. """
+        cache = self._done_cache
+        if cache is not None and cache[0] is observation and cache[1] is self._current_macro:
+            return cache[2]
+        result = self._current_macro.done(observation)
+        self._done_cache = (observation, self._current_macro, result)
+        return result
 
     def next_action(self, observation: Observation) -> Action:
         """ Get the next action from the macro action.
@@ -49,7 +63,7 @@ class MacroAgent(Agent):
         assert self._current_macro is not None, f"Macro action of Agent {self.agent_id} is None!"
 
         if self._current_macro.current_maneuver is not None and self._current_macro.current_maneuver.done(observation):
-            self._maneuver_end_idx.append(len(self.trajectory_cl.states) - 1)
+            self._maneuver_end_idx.append(len(self._trajectory_cl) - 1)
         return self._current_macro.next_action(observation)
 
     def next_state(self, observation: Observation, return_action: bool = False) -> AgentState:
@@ -62,9 +76,10 @@ class MacroAgent(Agent):
         Returns:
             The new state of the agent.
         """
+        my_state = observation.frame[self.agent_id]
         action = self.next_action(observation)
-        self.vehicle.execute_action(action, observation.frame[self.agent_id])
-        next_state = self.vehicle.get_state(observation.frame[self.agent_id].time + 1)
+        self.vehicle.execute_action(action, my_state)
+        next_state = self.vehicle.get_state(my_state.time + 1)
         next_state.macro_action = str(self.current_macro)
         next_state.maneuver = str(self.current_macro.current_maneuver)
 
@@ -73,14 +88,83 @@ class MacroAgent(Agent):
         else:
             return next_state, action
 
+    @classmethod
+    def batch_next_state(cls, agents: List["MacroAgent"], observation: Observation) -> Dict[int, AgentState]:
+        """ Advance several MacroAgents by one time step with a single vectorized kinematic update.
+
+        Actions are still selected per agent through next_action, but the bicycle-model integration
+        is applied to all vehicles at once on stacked state arrays instead of one interpreter-level
+        update per agent.
+
+        Args:
+            agents: The agents to advance. Each must drive a KinematicVehicle.
+            observation: Observation of current environment state and road layout.
+
+        Returns:
+            A frame mapping each agent ID to its new state.
+        """
+        actions = [agent.next_action(observation) for agent in agents]
+        n = len(agents)
+
+        # Gather vehicle states and parameters into SoA arrays
+        centers = np.empty((n, 2), dtype=np.float64)
+        headings = np.empty(n, dtype=np.float64)
+        velocities = np.empty(n, dtype=np.float64)
+        accelerations = np.empty(n, dtype=np.float64)
+        steer_angles = np.empty(n, dtype=np.float64)
+        max_accelerations = np.empty(n, dtype=np.float64)
+        max_angular_vels = np.empty(n, dtype=np.float64)
+        wheelbases = np.empty(n, dtype=np.float64)
+        l_rs = np.empty(n, dtype=np.float64)
+        dts = np.empty(n, dtype=np.float64)
+        for i, (agent, action) in enumerate(zip(agents, actions)):
+            vehicle = agent.vehicle
+            centers[i] = vehicle.center
+            headings[i] = vehicle.heading
+            velocities[i] = vehicle.velocity
+            accelerations[i] = action.acceleration
+            steer_angles[i] = action.steer_angle
+            max_accelerations[i] = vehicle.meta.max_acceleration
+            max_angular_vels[i] = vehicle.meta.max_angular_vel
+            wheelbases[i] = vehicle.meta.wheelbase
+            l_rs[i] = vehicle._l_r
+            dts[i] = vehicle._dt
+
+        # Vectorized bicycle-model update; mirrors KinematicVehicle.execute_action
+        accelerations = np.clip(accelerations, -max_accelerations, max_accelerations)
+        velocities = np.maximum(0.0, velocities + accelerations * dts)
+        betas = np.arctan(l_rs * np.tan(steer_angles) / wheelbases)
+        centers[:, 0] += velocities * np.cos(betas + headings) * dts
+        centers[:, 1] += velocities * np.sin(betas + headings) * dts
+        d_thetas = velocities * np.tan(steer_angles) * np.cos(betas) / wheelbases
+        d_thetas = np.clip(d_thetas, -max_angular_vels, max_angular_vels)
+        headings = (headings + d_thetas * dts + np.pi) % (2 * np.pi) - np.pi
+
+        # Scatter results back to the vehicles and build the new frame
+        new_frame = {}
+        for i, agent in enumerate(agents):
+            vehicle = agent.vehicle
+            vehicle.acceleration = accelerations[i]
+            vehicle.velocity = velocities[i]
+            vehicle.center = centers[i].copy()
+            vehicle.heading = headings[i]
+            vehicle.calculate_boundary()
+
+            next_state = vehicle.get_state(observation.frame[agent.agent_id].time + 1)
+            next_state.macro_action = str(agent.current_macro)
+            next_state.maneuver = str(agent.current_macro.current_maneuver)
+            new_frame[agent.agent_id] = next_state
+        return new_frame
+
     def reset(self):
         """ Reset the vehicle and macro action of the agent."""
         super(MacroAgent, self).reset()
         self._vehicle = KinematicVehicle(self._initial_state, self.metadata, self._fps)
         self._current_macro = None
+        self._done_cache = None
 
     def update_macro_action(self,
-                            macro_action: type(MacroAction),
+                            macro_action: Type[MacroAction],
                             args: Dict,
                             observation: Observation) -> MacroAction:
         """ Overwrite and initialise current macro action of the agent using the given arguments.
@@ -1,3 +1,4 @@
+from collections import deque
 from typing import List
 
 from igp2.agents.agent import Agent
@@ -18,12 +19,12 @@ class ManeuverAgent(Agent):
                  view_radius: float = None):
         super().__init__(agent_id, initial_state, view_radius)
         self._vehicle = TrajectoryVehicle(initial_state, initial_state.metadata, fps)
-        self.maneuver_configs = maneuver_configs
+        self.maneuver_configs = deque(maneuver_configs)
         self.maneuver = None
 
     def create_next_maneuver(self, agent_id, observation):
         if len(self.maneuver_configs) > 0:
-            config = self.maneuver_configs.pop(0)
+            config = self.maneuver_configs.popleft()
             config.config_dict["fps"] = self.fps
             self.maneuver = CLManeuverFactory.create(
                 config, agent_id, observation.frame, observation.scenario_map)
@@ -144,7 +144,7 @@ class MCTSAgent(TrafficAgent):
         self.update_observations(observation)
 
         if self._k >= self._kmax or self.current_macro is None or \
-                (self.current_macro.done(observation) and self._current_macro_id == len(self._macro_actions) - 1):
+                (self._macro_done(observation) and self._current_macro_id == len(self._macro_actions) - 1):
             self._goals = self.get_goals(observation)
             self.update_plan(observation)
             self.update_macro_action(self._macro_actions[0].macro_action_type,
@@ -152,7 +152,7 @@ class MCTSAgent(TrafficAgent):
                                      observation)
             self._k = 0
 
-        if self.current_macro.done(observation):
+        if self._macro_done(observation):
             self._advance_macro(observation)
 
         self._k += 1
@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 import logging
 
@@ -10,14 +12,29 @@ from igp2.recognition.astar import AStar
 
 logger = logging.getLogger(__name__)
 
+# Action is immutable, so the idle fallback can be shared instead of rebuilt every tick.
+_IDLE_ACTION = Action(0, 0)
+
+
+def _search_route(args) -> List[List[MacroAction]]:
+    """ Run a route search for a single agent in a worker process. """
+    agent_id, frame, goal, scenario_map = args
+    astar = AStar(max_iter=1000)
+    _, actions = astar.search(agent_id, frame, goal, scenario_map, open_loop=False)
+    return actions
+
 
 class TrafficAgent(MacroAgent):
     """ Agent that follows a list of MAs, optionally calculated using A*. """
 
+    # AStar.search keeps all search state in locals, so one instance can be
+    #  shared by every TrafficAgent instead of allocating one per agent.
+    _shared_astar = AStar(max_iter=1000)
+
     def __init__(self, agent_id: int, initial_state: AgentState, goal: "Goal" = None, fps: int = 20,
                  macro_actions: List[MacroAction] = None):
         super(TrafficAgent, self).__init__(agent_id, initial_state, goal, fps)
-        self._astar = AStar(max_iter=1000)
+        self._astar = TrafficAgent._shared_astar
         self._macro_actions = []
         if macro_actions is not None:
             self.set_macro_actions(macro_actions)
@@ -53,21 +70,51 @@ class TrafficAgent(MacroAgent):
         self._macro_actions = actions[0]
         self._current_macro = self._macro_actions[0]
 
+    @classmethod
+    def plan_batch(cls, agents: List["TrafficAgent"], observation: Observation, max_workers: int = None):
+        """ Plan routes for several TrafficAgents in parallel worker processes.
+
+            The route searches are independent of each other, so they are dispatched to a process
+            pool and the resulting macro action lists are assigned back to each agent.
+
+            Args:
+                agents: The agents to plan for. Each agent must have its goal set.
+                observation: The current observation shared by all agents.
+                max_workers: Maximum number of worker processes. Defaults to the CPU count.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        logger.info(f"Finding paths for {len(agents)} TrafficAgents using {max_workers} workers.")
+        tasks = [(agent.agent_id, observation.frame, agent.goal, observation.scenario_map)
+                 for agent in agents]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_search_route, tasks))
+
+        for agent, actions in zip(agents, results):
+            if len(actions) == 0:
+                raise RuntimeError(f"Couldn't find path to goal {agent.goal} for TrafficAgent {agent.agent_id}.")
+            agent._macro_actions = actions[0]
+            agent._current_macro = actions[0][0]
+            agent._current_macro_id = 0
+
     def done(self, observation: Observation) -> bool:
         """ Returns true if there are no more actions on the macro list and the current macro is finished. """
         return self._current_macro_id + 1 >= len(self._macro_actions) and super(TrafficAgent, self).done(observation)
 
     def next_action(self, observation: Observation) -> Action:
-        if self.current_macro is None:
-            if len(self._macro_actions) == 0:
-                self.set_destination(observation)
-
-        if self._current_macro.done(observation):
-            if self._current_macro_id < len(self._macro_actions):
+        # Bind hot attributes to locals; this runs once per agent on every tick.
+        macros = self._macro_actions
+        if self._current_macro is None and len(macros) == 0:
+            self.set_destination(observation)
+            macros = self._macro_actions
+
+        if self._macro_done(observation):
+            if self._current_macro_id < len(macros):
                 self._advance_macro(observation)
             else:
                 logger.warning(f"TrafficAgent {self.agent_id} has no macro actions!")
-                return Action(0, 0)
+                return _IDLE_ACTION
 
         return self._current_macro.next_action(observation)
 
@@ -50,10 +50,13 @@ class PointGoal(Goal):
         return f"PointGoal(center={np.round(self._center, 3)}, r={self._radius})"
 
     def reached(self, point: np.ndarray) -> bool:
-        return self.distance(Point(point)) <= self._radius
+        return self.distance(point) <= self._radius
 
     def distance(self, point: np.ndarray) -> float:
-        return Point(point).distance(Point(self._center))
+        # Scalar arithmetic instead of shapely: this is the A* heuristic hot path.
+        if isinstance(point, Point):
+            point = point.coords[0]
+        return np.hypot(point[0] - self._center[0], point[1] - self._center[1])
 
     def point_on_lane(self, lane: Lane) -> Optional[np.ndarray]:
         if lane.boundary.contains(Point(self._center)):
@@ -184,6 +184,8 @@ class StateTrajectory(Trajectory):
         super().__init__(path, velocity)
         self.fps = fps
         self._state_list = states if states is not None else []
+        self._path_buffer = None
+        self._velocity_buffer = None
         self.calculate_path_and_velocity()
 
     def __getitem__(self, item: int) -> AgentState:
@@ -256,6 +258,8 @@ class StateTrajectory(Trajectory):
         if self._state_list and len(self._state_list) > 0:
             self._path = np.array([state.position for state in self._state_list])
             self._velocity = np.array([state.speed for state in self._state_list])
+            self._path_buffer = None
+            self._velocity_buffer = None
 
     def add_state(self, new_state: AgentState, reload_path: bool = True):
         """ Add a new state at the end of the trajectory.
@@ -270,8 +274,21 @@ class StateTrajectory(Trajectory):
             if self._path is None or self._velocity is None:
                 self.calculate_path_and_velocity()
             else:
-                self._path = np.append(self._path, np.array([new_state.position]), axis=0)
-                self._velocity = np.append(self._velocity, new_state.speed)
+                # Appending into capacity-doubling buffers keeps per-state cost amortised
+                #  constant instead of reallocating the full arrays on every state
+                n = len(self._state_list)
+                if self._path_buffer is None or self._path_buffer.shape[0] < n:
+                    capacity = max(2 * n, 64)
+                    path_buffer = np.empty((capacity, 2), dtype=np.float64)
+                    velocity_buffer = np.empty(capacity, dtype=np.float64)
+                    path_buffer[:n - 1] = self._path
+                    velocity_buffer[:n - 1] = self._velocity
+                    self._path_buffer = path_buffer
+                    self._velocity_buffer = velocity_buffer
+                self._path_buffer[n - 1] = new_state.position
+                self._velocity_buffer[n - 1] = new_state.speed
+                self._path = self._path_buffer[:n]
+                self._velocity = self._velocity_buffer[:n]
 
     def extend(self, new_trajectory: "StateTrajectory", reload_path: bool = True, reset_times: bool = False):
         """ Extend the current trajectory with the states of the given trajectory. If the last state of the first
@@ -319,7 +336,7 @@ class VelocityTrajectory(Trajectory):
             timesteps: optional array containing the time elapsed between each consecutive point.
         """
         super().__init__(path, velocity)
-        self._pathlength = self.calculate_pathlength(path)
+        self._pathlength = None
 
         if heading is None:
             self._heading = self.heading_from_path(self.path)
@@ -336,12 +353,15 @@ class VelocityTrajectory(Trajectory):
 
     @property
     def pathlength(self) -> np.ndarray:
-        """ Length of path travelled at each position along the path in meters. """
-        return self._pathlength if self._pathlength is not None else np.array([])
+        """ Length of path travelled at each position along the path in meters.
+        Computed lazily on first access. """
+        if self._pathlength is None:
+            self._pathlength = self.calculate_pathlength(self._path)
+        return self._pathlength
 
     @property
     def length(self) -> float:
-        return self._pathlength[-1]
+        return self.pathlength[-1]
 
     @property
     def heading(self) -> np.ndarray:
@@ -366,8 +386,16 @@ class VelocityTrajectory(Trajectory):
                    heading)
 
     def calculate_pathlength(self, path) -> np.ndarray:
-        path_lengths = np.linalg.norm(np.diff(path, axis=0), axis=1)  # Length between points
-        return np.cumsum(np.append(0, path_lengths))
+        # hypot over the coordinate columns skips the intermediate (N-1, 2) diff array
+        dx = path[1:, 0] - path[:-1, 0]
+        dy = path[1:, 1] - path[:-1, 1]
+        path_lengths = np.hypot(dx, dy)  # Length between points
+        # Accumulate straight into the output array rather than copying the segment
+        #  lengths behind a prepended zero with np.append
+        pathlength = np.empty(len(path), dtype=np.float64)
+        pathlength[0] = 0.0
+        np.cumsum(path_lengths, out=pathlength[1:])
+        return pathlength
 
     def insert(self, trajectory: Trajectory):
         """ Inserts a Trajectory (in-place) at the beginning of the VelocityTrajectory object,
@@ -399,7 +427,7 @@ class VelocityTrajectory(Trajectory):
             self._timesteps = np.concatenate([self.timesteps, timesteps[1:]])
         heading = self.heading_from_path(path_p1)
         self._heading = np.concatenate([self.heading, heading[1:]])
-        self._pathlength = self.calculate_pathlength(self._path)
+        self._pathlength = None  # Recomputed lazily for the extended path
 
     def slice(self, start_idx: Optional[int], end_idx: Optional[int]) -> "VelocityTrajectory":
         """ Return a slice of the original VelocityTrajectory"""
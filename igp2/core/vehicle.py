@@ -1,4 +1,5 @@
-from typing import Dict
+import math
+from typing import Dict, Tuple
 import numpy as np
 import matplotlib.pyplot as plt
 from dataclasses import dataclass
@@ -111,18 +112,17 @@ class KinematicVehicle(Vehicle):
         Returns:
             Acceleration and heading action that was executed by the vehicle.
         """
-        self.acceleration = np.clip(action.acceleration, - self.meta.max_acceleration, self.meta.max_acceleration)
-        self.velocity += self.acceleration * self._dt
-        self.velocity = max(0, self.velocity)
-        beta = np.arctan(self._l_r * np.tan(action.steer_angle) / self.meta.wheelbase)
-        d_position = np.array(
-            [self.velocity * np.cos(beta + self.heading),
-             self.velocity * np.sin(beta + self.heading)]
-        )
-        self.center += d_position * self._dt
-        d_theta = self.velocity * np.tan(action.steer_angle) * np.cos(beta) / self.meta.wheelbase
-        d_theta = np.clip(d_theta, - self.meta.max_angular_vel, self.meta.max_angular_vel)
-        self.heading = (self.heading + d_theta * self._dt + np.pi) % (2*np.pi) - np.pi
+        # Scalar math-module arithmetic: NumPy ufuncs on Python scalars dominate the
+        #  cost of this per-tick update through dispatch overhead.
+        self.acceleration = min(max(-self.meta.max_acceleration, action.acceleration),
+                                self.meta.max_acceleration)
+        self.velocity = max(0.0, self.velocity + self.acceleration * self._dt)
+        beta = math.atan(self._l_r * math.tan(action.steer_angle) / self.meta.wheelbase)
+        self.center[0] += self.velocity * math.cos(beta + self.heading) * self._dt
+        self.center[1] += self.velocity * math.sin(beta + self.heading) * self._dt
+        d_theta = self.velocity * math.tan(action.steer_angle) * math.cos(beta) / self.meta.wheelbase
+        d_theta = min(max(-self.meta.max_angular_vel, d_theta), self.meta.max_angular_vel)
+        self.heading = (self.heading + d_theta * self._dt + math.pi) % (2 * math.pi) - math.pi
 
         # # Unicycle model
         # self.acceleration = np.clip(action.acceleration, - self.meta.max_acceleration, self.meta.max_acceleration)
@@ -136,3 +136,55 @@ class KinematicVehicle(Vehicle):
 
         self.calculate_boundary()
         return Action(float(self.acceleration), float(d_theta))
+
+    def execute_actions(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Apply a sequence of actions to the vehicle in a single call.
+
+        Integrates k Euler steps of the bicycle model in one fused loop using scalar arithmetic.
+        The step-to-step velocity and heading recurrence prevents full vectorization, but batching
+        the steps removes the per-step method dispatch and NumPy scalar overhead of calling
+        execute_action k times.
+
+        Args:
+            actions: A (k, 2) array of (acceleration, steering angle) pairs.
+
+        Returns:
+            Arrays of the vehicle center, heading and velocity after each of the k steps.
+        """
+        k = len(actions)
+        centers = np.empty((k, 2), dtype=np.float64)
+        headings = np.empty(k, dtype=np.float64)
+        velocities = np.empty(k, dtype=np.float64)
+
+        x, y = float(self.center[0]), float(self.center[1])
+        heading = float(self.heading)
+        velocity = float(self.velocity)
+        acceleration = 0.0
+        dt = self._dt
+        l_r = self._l_r
+        wheelbase = self.meta.wheelbase
+        max_acceleration = self.meta.max_acceleration
+        max_angular_vel = self.meta.max_angular_vel
+
+        for i in range(k):
+            acceleration = min(max(-max_acceleration, actions[i, 0]), max_acceleration)
+            velocity = max(0.0, velocity + acceleration * dt)
+            steer_angle = actions[i, 1]
+            beta = math.atan(l_r * math.tan(steer_angle) / wheelbase)
+            x += velocity * math.cos(beta + heading) * dt
+            y += velocity * math.sin(beta + heading) * dt
+            d_theta = velocity * math.tan(steer_angle) * math.cos(beta) / wheelbase
+            d_theta = min(max(-max_angular_vel, d_theta), max_angular_vel)
+            heading = (heading + d_theta * dt + math.pi) % (2 * math.pi) - math.pi
+
+            centers[i, 0] = x
+            centers[i, 1] = y
+            headings[i] = heading
+            velocities[i] = velocity
+
+        self.center = centers[-1].copy()
+        self.heading = heading
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.calculate_boundary()
+        return centers, headings, velocities
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import abc
+import math
 from typing import List, Tuple
 
 import numpy as np
@@ -19,7 +20,11 @@ __status__ = "Released"
 
 def normalise_angle(angle):
     """ Normalise angle to the range [-pi, pi] in radians """
-    return np.arctan2(np.sin(angle), np.cos(angle))
+    if isinstance(angle, np.ndarray):
+        return np.arctan2(np.sin(angle), np.cos(angle))
+    # The IEEE-754 remainder lands in [-pi, pi] with a single C call, avoiding the
+    #  numpy scalar dispatch of the trigonometric round-trip on this hot path
+    return math.remainder(angle, 2.0 * math.pi)
 
 
 def ramer_douglas(curve: List[Tuple[float, float]], dist: float):
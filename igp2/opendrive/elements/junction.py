@@ -223,9 +223,14 @@ class Junction:
         Warning: This function assumes that all roads in the junction are connecting roads.
         """
         ret = []
+        # Deduplicate by object identity: membership scans over the list would run the
+        #  expensive field-by-field Road equality check per connection.
+        seen = set()
         for connection in self._connections:
-            if connection.connecting_road not in ret:
-                ret.append(connection.connecting_road)
+            road = connection.connecting_road
+            if id(road) not in seen:
+                seen.add(id(road))
+                ret.append(road)
         return ret
 
     def get_all_connecting_roads(self, incoming_road: "Road") -> List["Road"]:
@@ -32,6 +32,8 @@ class Road:
         self._junction = None
         self._length = None
         self._boundary = None
+        self._drivable = None
+        self._flat_lanes = None
 
         self._header = None  # TODO
         self._link = RoadLink()
@@ -237,10 +239,20 @@ class Road:
         """ Container object for all LaneSections of the road"""
         return self._lanes
 
+    @property
+    def flat_lanes(self) -> Tuple:
+        """ Flattened tuple of the lanes of every lane section of the road. Cached on first
+        access, so query loops avoid re-walking the lane sections. """
+        if self._flat_lanes is None:
+            self._flat_lanes = tuple(lane for ls in self.lanes.lane_sections for lane in ls.all_lanes)
+        return self._flat_lanes
+
     @property
     def drivable(self) -> bool:
-        """ True if at least one lane is drivable in the road. """
-        return any([ls.drivable for ls in self.lanes.lane_sections])
+        """ True if at least one lane is drivable in the road. Cached on first access. """
+        if self._drivable is None:
+            self._drivable = any([ls.drivable for ls in self.lanes.lane_sections])
+        return self._drivable
 
     @property
     def all_lane_forwards(self) -> bool:
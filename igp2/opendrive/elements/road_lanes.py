@@ -568,6 +568,7 @@ class LaneSection:
         self._left_lanes = LeftLanes()
         self._center_lanes = CenterLanes()
         self._right_lanes = RightLanes()
+        self._all_lanes = None
         self._parent_road = road
         self._drivable = None
         self.length = 0.0
@@ -606,8 +607,11 @@ class LaneSection:
 
     @property
     def all_lanes(self) -> List[Lane]:
-        """ Concatenate all lanes into a single array. Lanes are not sorted by id!"""
-        return self._left_lanes.lanes + self._center_lanes.lanes + self._right_lanes.lanes
+        """ Concatenate all lanes into a single array. Lanes are not sorted by id!
+        The concatenation is cached on first access, after parsing has populated the lanes. """
+        if self._all_lanes is None:
+            self._all_lanes = self._left_lanes.lanes + self._center_lanes.lanes + self._right_lanes.lanes
+        return self._all_lanes
 
     @property
     def drivable(self) -> bool:
@@ -1,8 +1,10 @@
 import logging
 import numpy as np
+import shapely
 
 from typing import Union, Tuple, List, Dict, Optional
 from shapely.geometry import Point
+from shapely.strtree import STRtree
 
 from lxml import etree
 
@@ -44,28 +46,102 @@ class Map(object):
         self.__geo_reference = self.__opendrive.header.geo_reference
 
     def __process_road_layout(self):
-        roads = {}
+        # Roads, junctions and junction groups are stored as contiguous lists with a
+        #  separate id -> index map: iteration in the query paths walks a packed list
+        #  while by-id lookup stays O(1). The dict views exposed by the corresponding
+        #  properties are built lazily for backward compatibility.
+        roads, road_id_to_idx = [], {}
         for road in self.__opendrive.roads:
             road.plan_view.precalculate(linestring=True)
             road.calculate_road_geometry(resolution=min(road.plan_view.length / 4, 0.25))
 
-            assert road.id not in roads
-            roads[road.id] = road
-        self.__roads = roads
+            assert road.id not in road_id_to_idx
+            road_id_to_idx[road.id] = len(roads)
+            roads.append(road)
+        self.__roads_list = roads
+        self.__road_id_to_idx = road_id_to_idx
+        self.__roads_dict = None
 
-        junctions = {}
+        junctions, junction_id_to_idx = [], {}
         for junction in self.__opendrive.junctions:
             junction.calculate_boundary()
 
-            assert junction.id not in junctions
-            junctions[junction.id] = junction
-        self.__junctions = junctions
+            assert junction.id not in junction_id_to_idx
+            junction_id_to_idx[junction.id] = len(junctions)
+            junctions.append(junction)
+        self.__junctions_list = junctions
+        self.__junction_id_to_idx = junction_id_to_idx
+        self.__junctions_dict = None
 
-        junction_groups = {}
+        junction_groups, junction_group_id_to_idx = [], {}
         for junction_group in self.__opendrive.junction_groups:
-            assert junction_group.id not in junction_groups
-            junction_groups[junction_group.id] = junction_group
-        self.__junction_groups = junction_groups
+            assert junction_group.id not in junction_group_id_to_idx
+            junction_group_id_to_idx[junction_group.id] = len(junction_groups)
+            junction_groups.append(junction_group)
+        self.__junction_groups_list = junction_groups
+        self.__junction_group_id_to_idx = junction_group_id_to_idx
+        self.__junction_groups_dict = None
+
+        self.__build_spatial_indices()
+
+    def __build_spatial_indices(self):
+        """ Build STR-tree indices over the road, lane and junction boundaries so that point-location
+        queries only run precise distance checks on a handful of candidates instead of scanning
+        every geometry in the map. """
+        self.__road_index = [road for road in self.__roads_list if road.boundary is not None]
+        self.__road_tree = STRtree([road.boundary for road in self.__road_index])
+
+        self.__lane_index = [lane
+                             for road in self.__road_index
+                             for lane in road.flat_lanes
+                             if lane.boundary is not None and not lane.boundary.is_empty]
+        self.__lane_tree = STRtree([lane.boundary for lane in self.__lane_index])
+        # Bounding boxes as a (N, 4) [minx, miny, maxx, maxy] array for coarse rejection
+        #  with plain float compares before paying for a precise GEOS distance call
+        self.__lane_bounds = shapely.bounds(np.array([lane.boundary for lane in self.__lane_index],
+                                                     dtype=object)) \
+            if self.__lane_index else np.empty((0, 4))
+        self.__lane_rows = {id(lane): i for i, lane in enumerate(self.__lane_index)}
+
+        self.__junction_index = [junction for junction in self.__junctions_list
+                                 if junction.boundary is not None]
+        self.__junction_tree = STRtree([junction.boundary for junction in self.__junction_index])
+
+        self.__angle_cache = {}
+        self.__roundabout_cache = {}
+        # Resolve the roundabout mask for the whole road graph up-front so that hot-path
+        #  queries are a single dict lookup. Roads whose walk cannot be resolved are left
+        #  uncached, so the original RuntimeError still surfaces if they are ever queried.
+        for road in self.__road_index:
+            try:
+                self.__roundabout_cache[road.id] = self.__road_in_roundabout(road, 7)
+            except RuntimeError:
+                pass
+
+    ANGLE_CACHE_SIZE = 10000  # Maximum number of memoized road heading queries
+
+    def _road_heading_at(self, road: Road, point: Point) -> float:
+        """ Return the heading of the road reference line at the given point.
+
+        The midline projection is a GEOS linear-reference scan and plan_view.calc another
+        non-trivial computation, while both are invariant for a given road and point. Planners
+        repeatedly query the same waypoints, so results are memoized in a bounded cache.
+
+        Args:
+            road: The road whose heading to compute
+            point: Point in cartesian coordinates
+
+        Returns:
+            Heading of the road reference line at the point in radians
+        """
+        key = (road.id, round(point.x, 6), round(point.y, 6))
+        angle = self.__angle_cache.get(key)
+        if angle is None:
+            if len(self.__angle_cache) >= Map.ANGLE_CACHE_SIZE:
+                self.__angle_cache.clear()
+            _, angle = road.plan_view.calc(road.midline.project(point))
+            self.__angle_cache[key] = angle
+        return angle
 
     def __repr__(self):
         return f"Map(name={self.name})"
@@ -86,10 +162,13 @@ class Map(object):
         if max_distance is None:
             max_distance = Map.ROAD_PRECISION_ERROR
 
-        point = Point(point)
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
         candidates = []
-        for road_id, road in self.roads.items():
-            if road.boundary is not None and road.boundary.distance(point) < max_distance:
+        # Sorted indices preserve the original road insertion order of the map
+        for idx in np.sort(self.__road_tree.query(point, predicate="dwithin", distance=max_distance)):
+            road = self.__road_index[idx]
+            if road.boundary.distance(point) < max_distance:
                 if drivable and not road.drivable: continue
                 candidates.append(road)
         return candidates
@@ -111,19 +190,55 @@ class Map(object):
             max_distance = Map.LANE_PRECISION_ERROR
 
         candidates = []
-        point = Point(point)
-        roads = self.roads_at(point, max_distance=max_distance)
-        for road in roads:
-            for lane_section in road.lanes.lane_sections:
-                for lane in lane_section.all_lanes:
-                    if (lane.boundary is not None and
-                            not lane.boundary.is_empty and
-                            lane.boundary.distance(point) < max_distance and
-                            (not drivable_only or lane.type == LaneTypes.DRIVING) and
-                            lane not in candidates):
-                        candidates.append(lane)
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
+        for idx in np.sort(self.__lane_tree.query(point, predicate="dwithin", distance=max_distance)):
+            lane = self.__lane_index[idx]
+            if lane.boundary.distance(point) < max_distance and \
+                    (not drivable_only or lane.type == LaneTypes.DRIVING):
+                candidates.append(lane)
         return candidates
 
+    def nearest_road(self, point: Union[Point, Tuple[float, float], np.ndarray]) -> Optional[Road]:
+        """ Return the road whose boundary is nearest to the given point, even if the point does not
+        lie on any road.
+
+        Args:
+            point: Point in cartesian coordinates
+
+        Returns:
+            The nearest Road, or None if the map has no roads with a boundary
+        """
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
+        if not self.__road_index:
+            return None
+        return self.__road_index[self.__road_tree.nearest(point)]
+
+    def nearest_lane(self, point: Union[Point, Tuple[float, float], np.ndarray],
+                     drivable_only: bool = False) -> Optional[Lane]:
+        """ Return the lane whose boundary is nearest to the given point, even if the point does not
+        lie on any lane.
+
+        Args:
+            point: Point in cartesian coordinates
+            drivable_only: If True, only consider drivable lanes
+
+        Returns:
+            The nearest Lane, or None if the map has no lanes with a boundary
+        """
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
+        if not self.__lane_index:
+            return None
+        if not drivable_only:
+            return self.__lane_index[self.__lane_tree.nearest(point)]
+        lanes = [lane for lane in self.__lane_index if lane.type == LaneTypes.DRIVING]
+        if not lanes:
+            return None
+        distances = shapely.distance(np.array([lane.boundary for lane in lanes], dtype=object), point)
+        return lanes[int(np.argmin(distances))]
+
     def roads_within_angle(self, point: Union[Point, Tuple[float, float], np.ndarray],
                            heading: float, threshold: float, max_distance: float = None) -> List[Road]:
         """ Return a list of Roads whose angular distance from the given heading is within the given threshold. If only
@@ -145,25 +260,29 @@ class Map(object):
         if max_distance is None:
             max_distance = Map.ROAD_PRECISION_ERROR
 
-        point = Point(point)
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
 
         roads = self.roads_at(point, max_distance=max_distance)
         if len(roads) == 1:
             return roads
 
-        junction_at_point = self.junction_at(point)
-        if len(roads) > 1 and junction_at_point is not None:
-            roads = junction_at_point.roads
+        # Only look up the junction when its roads could actually replace the candidates
+        if len(roads) > 1:
+            junction_at_point = self.junction_at(point)
+            if junction_at_point is not None:
+                roads = junction_at_point.roads
 
         ret = []
         original_heading = normalise_angle(heading)
         for road in roads:
-            _, angle = road.plan_view.calc(road.midline.project(point))
-            if road.junction is None and np.abs(original_heading - angle) > np.pi / 2:
+            angle = self._road_heading_at(road, point)
+            # Built-in abs on plain floats avoids the numpy scalar ufunc dispatch per road
+            if road.junction is None and abs(original_heading - angle) > np.pi / 2:
                 heading = normalise_angle(original_heading + np.pi)
             else:
                 heading = original_heading
-            diff = np.abs(normalise_angle(heading - angle))
+            diff = abs(normalise_angle(heading - angle))
             if diff < threshold:
                 ret.append(road)
         return ret
@@ -187,24 +306,35 @@ class Map(object):
         if max_distance is None:
             max_distance = Map.LANE_PRECISION_ERROR
 
-        point = Point(point)
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
+        px, py = point.x, point.y
         ret = []
         roads = self.roads_within_angle(point, heading, threshold, max_distance=max_distance)
         for road in roads:
-            for lane_section in road.lanes.lane_sections:
-                for lane in lane_section.all_lanes:
-
-                    _, original_angle = road.plan_view.calc(road.midline.project(point))
-                    if lane.id > 0:
-                        angle = normalise_angle(original_angle + np.pi)
-                    else:
-                        angle = original_angle
-                    angle_diff = np.abs(normalise_angle(heading - angle))
+            # The road heading is invariant across the lanes of the road
+            original_angle = self._road_heading_at(road, point)
+            for lane in road.flat_lanes:
+                row = self.__lane_rows.get(id(lane))
+                if row is None:  # Lane without a valid boundary
+                    continue
+
+                # Coarse bounding-box rejection before the precise GEOS distance call
+                minx, miny, maxx, maxy = self.__lane_bounds[row]
+                if px < minx - max_distance or px > maxx + max_distance or \
+                        py < miny - max_distance or py > maxy + max_distance:
+                    continue
+
+                if lane.id > 0:
+                    angle = normalise_angle(original_angle + np.pi)
+                else:
+                    angle = original_angle
+                angle_diff = abs(normalise_angle(heading - angle))
 
-                    if lane.boundary is not None and lane.boundary.distance(point) < max_distance and \
-                            lane.id != 0 and (not drivable_only or lane.type == LaneTypes.DRIVING) \
-                            and angle_diff < threshold:
-                        ret.append(lane)
+                if lane.boundary.distance(point) < max_distance and \
+                        lane.id != 0 and (not drivable_only or lane.type == LaneTypes.DRIVING) \
+                        and angle_diff < threshold:
+                    ret.append(lane)
         return ret
 
     def best_road_at(self,
@@ -225,7 +355,8 @@ class Map(object):
             A Road passing through point with its direction closest to the given heading, or None.
 
         """
-        point = Point(point)
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
         roads = self.roads_at(point)
         if len(roads) == 0:
             logger.debug(f"No roads found at point: {point}!")
@@ -239,12 +370,12 @@ class Map(object):
         for road in roads:
             if drivable and not road.drivable: continue
 
-            _, angle = road.plan_view.calc(road.midline.project(point))
+            angle = self._road_heading_at(road, point)
             heading = original_heading
             if road.junction:
                 if road.all_lane_backwards:
                     angle = normalise_angle(angle + np.pi)
-            elif np.abs(original_heading - angle) > np.pi / 2:
+            elif abs(original_heading - angle) > np.pi / 2:
                 heading = normalise_angle(original_heading + np.pi)
             diff = abs((heading - angle + np.pi) % (2 * np.pi) - np.pi)
 
@@ -298,27 +429,49 @@ class Map(object):
         if max_distance is None:
             max_distance = Map.LANE_PRECISION_ERROR
 
-        point = Point(point)
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
         road = self.best_road_at(point, heading, goal=goal)
         if road is None:
             return None
 
+        candidates = [lane
+                      for lane in road.flat_lanes
+                      if lane.boundary is not None and lane.id != 0 and
+                      (not drivable_only or lane.type == LaneTypes.DRIVING)]
+
+        # Coarse bounding-box rejection: lanes whose inflated bbox misses the point can
+        #  never pass the distance check, so they are dropped before the GEOS call
+        px, py = point.x, point.y
+        lanes = []
+        for lane in candidates:
+            row = self.__lane_rows.get(id(lane))
+            if row is not None:
+                minx, miny, maxx, maxy = self.__lane_bounds[row]
+                if px < minx - max_distance or px > maxx + max_distance or \
+                        py < miny - max_distance or py > maxy + max_distance:
+                    continue
+            lanes.append(lane)
+        if not lanes:
+            return None
+
+        # One vectorized GEOS call instead of a Python-level distance call per lane
+        distances = shapely.distance(np.array([lane.boundary for lane in lanes], dtype=object), point)
+
         best = None
-        _, original_angle = road.plan_view.calc(road.midline.project(point))
-        for lane_section in road.lanes.lane_sections:
-            for lane in lane_section.all_lanes:
-                if lane.boundary is not None and lane.id != 0 and (not drivable_only or lane.type == LaneTypes.DRIVING):
-                    distance = lane.boundary.distance(point)
-                    if distance < max_distance:
-                        angle_diff = 0.0
-                        if heading is not None:
-                            if lane.id > 0:
-                                angle = normalise_angle(original_angle + np.pi)
-                            else:
-                                angle = original_angle
-                            angle_diff = np.abs(heading - angle)
-                        if best is None or best[0] > angle_diff + distance:
-                            best = (angle_diff + distance, lane)
+        # Cache hit whenever best_road_at already computed the heading of this road
+        original_angle = self._road_heading_at(road, point)
+        for lane, distance in zip(lanes, distances):
+            if distance < max_distance:
+                angle_diff = 0.0
+                if heading is not None:
+                    if lane.id > 0:
+                        angle = normalise_angle(original_angle + np.pi)
+                    else:
+                        angle = original_angle
+                    angle_diff = abs(heading - angle)
+                if best is None or best[0] > angle_diff + distance:
+                    best = (angle_diff + distance, lane)
 
         return best[1] if best is not None else None
 
@@ -331,9 +484,12 @@ class Map(object):
         Returns:
             A Junction object or None
         """
-        point = Point(point)
-        for junction_id, junction in self.junctions.items():
-            if junction.boundary is not None and junction.boundary.distance(point) < Map.JUNCTION_PRECISION_ERROR:
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
+        for idx in np.sort(self.__junction_tree.query(
+                point, predicate="dwithin", distance=Map.JUNCTION_PRECISION_ERROR)):
+            junction = self.__junction_index[idx]
+            if junction.boundary.distance(point) < Map.JUNCTION_PRECISION_ERROR:
                 return junction
         return None
 
@@ -377,7 +533,8 @@ class Map(object):
         Returns:
             A list of all adjacent Lane objects on the same Road
         """
-        point = Point(point)
+        if not isinstance(point, Point):  # Avoid re-wrapping Points passed down from callers
+            point = Point(point)
         current_lane = self.best_lane_at(point, heading)
         return self.get_adjacent_lanes(current_lane, same_direction, drivable_only)
 
@@ -394,10 +551,10 @@ class Map(object):
             List of adjacent lanes
         """
         adjacents = []
-        direction = np.sign(current_lane.id)
+        direction = current_lane.id > 0
         for lane in current_lane.lane_section.all_lanes:
             if lane.id != current_lane.id and lane.id != 0:
-                dirs_equal = np.sign(lane.id) == direction
+                dirs_equal = (lane.id > 0) == direction
                 drivable = lane.type == LaneTypes.DRIVING
                 if same_direction and drivable_only:
                     if dirs_equal and drivable:
@@ -441,7 +598,15 @@ class Map(object):
         Returns:
             True if the road is part of a roundabout
         """
-
+        # The road graph is immutable, so the walk below runs at most once per road
+        cached = self.__roundabout_cache.get(road.id)
+        if cached is not None:
+            return cached
+        result = self.__road_in_roundabout(road, iters)
+        self.__roundabout_cache[road.id] = result
+        return result
+
+    def __road_in_roundabout(self, road: Road, iters: int) -> bool:
         def check_element(e) -> Optional[bool]:
             if isinstance(e, Junction):
                 return e.junction_group is not None and e.junction_group.type == "roundabout"
@@ -501,26 +666,24 @@ class Map(object):
         Returns:
             Lane
         """
-        lane_sections = self.roads.get(road_id).lanes.lane_sections
+        lane_sections = self.__roads_list[self.__road_id_to_idx[road_id]].lanes.lane_sections
         assert 0 <= lane_section_idx < len(lane_sections), "Invalid lane section index given"
         return lane_sections[lane_section_idx].get_lane(lane_id)
 
     def is_valid(self):
         """ Checks if the Map geometry is valid. """
-        for road in self.roads.values():
-            if road.boundary is None or not road.boundary.is_valid:
-                return False
-
-            for lane_section in road.lanes.lane_sections:
-                for lane in lane_section.left_lanes + lane_section.right_lanes:
-                    if lane.boundary is None or not lane.boundary.is_valid:
-                        return False
-
-        for junction in self.junctions.values():
-            if junction.boundary is None or not junction.boundary.is_valid:
-                return False
-
-        return True
+        road_boundaries = [road.boundary for road in self.__roads_list]
+        lane_boundaries = [lane.boundary
+                           for road in self.__roads_list
+                           for lane_section in road.lanes.lane_sections
+                           for lane in lane_section.left_lanes + lane_section.right_lanes]
+        junction_boundaries = [junction.boundary for junction in self.__junctions_list]
+
+        boundaries = road_boundaries + lane_boundaries + junction_boundaries
+        if any(boundary is None for boundary in boundaries):
+            return False
+        # Single vectorized validity check over all boundaries
+        return bool(shapely.is_valid(np.array(boundaries, dtype=object)).all())
 
     @property
     def name(self) -> str:
@@ -540,15 +703,22 @@ class Map(object):
     @property
     def roads(self) -> Dict[int, Road]:
         """ Dictionary of all roads in the map with keys the road IDs """
-        return self.__roads
+        if self.__roads_dict is None:
+            self.__roads_dict = {road.id: road for road in self.__roads_list}
+        return self.__roads_dict
 
     @property
     def junctions(self) -> Dict[int, Junction]:
-        return self.__junctions
+        if self.__junctions_dict is None:
+            self.__junctions_dict = {junction.id: junction for junction in self.__junctions_list}
+        return self.__junctions_dict
 
     @property
     def junction_groups(self) -> Dict[int, JunctionGroup]:
-        return self.__junction_groups
+        if self.__junction_groups_dict is None:
+            self.__junction_groups_dict = {junction_group.id: junction_group
+                                           for junction_group in self.__junction_groups_list}
+        return self.__junction_groups_dict
 
     @property
     def north(self) -> float:
@@ -1,6 +1,7 @@
-import imageio
 import matplotlib.pyplot as plt
 import numpy as np
+import shapely
+from matplotlib.collections import LineCollection, PolyCollection
 
 from . import Map
 from .elements.road_lanes import LaneTypes
@@ -48,6 +49,8 @@ def plot_map(odr_map: Map, ax: plt.Axes = None, scenario_config=None, **kwargs)
         if scenario_config is None:
             raise ValueError("scenario_config must be provided to draw background")
         else:
+            import imageio  # Deferred: only needed when drawing a background image
+
             background_path = scenario_config.data_root + '/' + scenario_config.background_image
             background = imageio.imread(background_path)
             rescale_factor = scenario_config.background_px_to_meter
@@ -78,18 +81,21 @@ def plot_map(odr_map: Map, ax: plt.Axes = None, scenario_config=None, **kwargs)
     if kwargs.get("ignore_roads", False):
         return ax
 
+    # Collect all polylines first and draw each group with a single LineCollection,
+    #  avoiding one Line2D artist per boundary/midline
+    boundary_segments, boundary_colors = [], []
+    midline_segments, midline_colors = [], []
+    marking_lines, marking_dists, marking_styles = [], [], []
     for road_id, road in odr_map.roads.items():
         boundary = road.boundary.boundary
         if road.junction is None or not kwargs.get("hide_road_bounds_in_junction", False):
             if boundary.geom_type == "LineString":
-                ax.plot(boundary.xy[0],
-                        boundary.xy[1],
-                        color=kwargs.get("road_color", "k"))
+                boundary_segments.append(np.asarray(boundary.xy).T)
+                boundary_colors.append(kwargs.get("road_color", "k"))
             elif boundary.geom_type == "MultiLineString":
                 for b in boundary.geoms:
-                    ax.plot(b.xy[0],
-                            b.xy[1],
-                            color=kwargs.get("road_color", "orange"))
+                    boundary_segments.append(np.asarray(b.xy).T)
+                    boundary_colors.append(kwargs.get("road_color", "orange"))
 
         color = kwargs.get("midline_color", colors[road_id % len(colors)] if kwargs.get("road_ids", False) else "r")
         if kwargs.get("midline", False):
@@ -106,9 +112,8 @@ def plot_map(odr_map: Map, ax: plt.Axes = None, scenario_config=None, **kwargs)
                                   width=0.0025, headwidth=2,
                                   scale_units='xy', angles='xy', scale=1, color="red")
                     else:
-                        ax.plot(lane.midline.xy[0],
-                                lane.midline.xy[1],
-                                color=color)
+                        midline_segments.append(np.asarray(lane.midline.xy).T)
+                        midline_colors.append(color)
 
         if kwargs.get("road_ids", False):
             mid_point = len(road.midline.xy) // 2
@@ -126,27 +131,48 @@ def plot_map(odr_map: Map, ax: plt.Axes = None, scenario_config=None, **kwargs)
                             if style is None:
                                 continue
                             df = 0.13  # Distance between parallel lines
-                            side = "left" if lane.id <= 0 else "right"
-                            line = lane.reference_line.parallel_offset(i * df, side=side)
-                            ax.plot(line.xy[0], line.xy[1],
-                                    color=marker.color_to_rgb,
-                                    linestyle=style,
-                                    linewidth=marker.plot_width)
-
+                            sign = 1.0 if lane.id <= 0 else -1.0  # Positive offsets are left of the line
+                            marking_lines.append(lane.reference_line)
+                            marking_dists.append(sign * i * df)
+                            marking_styles.append((marker.color_to_rgb, style, marker.plot_width))
+
+    if marking_lines:
+        # One vectorized GEOS call for every marking offset instead of one call per marking
+        offset_lines = shapely.offset_curve(np.array(marking_lines, dtype=object),
+                                            np.array(marking_dists))
+        marking_groups = {}
+        for line, (color, style, width) in zip(offset_lines, marking_styles):
+            if line.is_empty:
+                continue
+            geoms = line.geoms if line.geom_type == "MultiLineString" else [line]
+            key = (color if isinstance(color, str) else tuple(color), style, width)
+            marking_groups.setdefault(key, []).extend(np.asarray(g.xy).T for g in geoms)
+        for (color, style, width), segments in marking_groups.items():
+            ax.add_collection(LineCollection(segments, colors=[color],
+                                             linestyles=style, linewidths=width))
+
+    if boundary_segments:
+        ax.add_collection(LineCollection(boundary_segments, colors=boundary_colors,
+                                         linewidths=plt.rcParams["lines.linewidth"]))
+    if midline_segments:
+        ax.add_collection(LineCollection(midline_segments, colors=midline_colors,
+                                         linewidths=plt.rcParams["lines.linewidth"]))
+
+    junction_color = kwargs.get("junction_color", (0.941, 1.0, 0.420, 0.5))
+    junction_patches = []
     for junction_id, junction in odr_map.junctions.items():
         if junction.boundary.geom_type == "Polygon":
-            ax.fill(junction.boundary.boundary.xy[0],
-                    junction.boundary.boundary.xy[1],
-                    color=kwargs.get("junction_color", (0.941, 1.0, 0.420, 0.5)))
+            junction_patches.append(np.asarray(junction.boundary.boundary.xy).T)
         else:
             if hasattr(junction.boundary, "geoms"):
                 geoms = junction.boundary.geoms
             else:
                 geoms = junction.boundary
             for polygon in geoms:
-                ax.fill(polygon.boundary.xy[0],
-                        polygon.boundary.xy[1],
-                        color=kwargs.get("junction_color", (0.941, 1.0, 0.420, 0.5)))
+                junction_patches.append(np.asarray(polygon.boundary.xy).T)
+    if junction_patches:
+        ax.add_collection(PolyCollection(junction_patches, facecolors=junction_color,
+                                         edgecolors=junction_color))
     return ax
 
 
@@ -657,14 +657,21 @@ class Exit(MacroAction):
         return maneuvers
 
     def _nearest_lane_to_goal(self, lane_list: List[Lane]) -> Lane:
-        best_lane = None
-        best_distance = np.inf
-        for connecting_lane in lane_list:
-            distance = np.linalg.norm(self.turn_target - np.array(connecting_lane.midline.coords[-1]))
-            if distance < self.TURN_TARGET_THRESHOLD and distance < best_distance:
-                best_lane = connecting_lane
-                best_distance = distance
-        return best_lane
+        if not lane_list:
+            return None
+
+        # Fill a preallocated buffer with the lane endpoints and compare squared
+        #  distances to avoid per-lane array allocations and the sqrt pass.
+        endpoints = np.empty((len(lane_list), 2), dtype=np.float64)
+        for i, connecting_lane in enumerate(lane_list):
+            endpoints[i] = connecting_lane.midline.coords[-1]
+        endpoints -= self.turn_target
+        sq_distances = np.einsum("ij,ij->i", endpoints, endpoints)
+
+        closest = sq_distances.argmin()
+        if sq_distances[closest] < self.TURN_TARGET_THRESHOLD ** 2:
+            return lane_list[closest]
+        return None
 
     def _find_current_lane(self, state: AgentState, in_junction: bool) -> Lane:
         if not in_junction:
@@ -692,11 +699,11 @@ class Exit(MacroAction):
     def get_possible_args(state: AgentState, scenario_map: Map, goal: Goal = None) -> List[Dict]:
         """ Return turn endpoint if approaching junction; if in junction
         return all possible turns within angle threshold"""
-        targets = []
+        possible_args = []
         current_lane = scenario_map.best_lane_at(state.position, state.heading)
+        assert current_lane is not None, f"No lane found at={state.position}, heading={state.heading}, goal={goal}"
         junction = current_lane.parent_road.junction is not None
         connecting_lanes = current_lane.link.successor
-        assert current_lane is not None, f"No lane found at={state.position}, heading={state.heading}, goal={goal}"
 
         if junction:
             if current_lane.link.predecessor is not None and len(current_lane.link.predecessor) == 1:
@@ -706,11 +713,14 @@ class Exit(MacroAction):
                 raise RuntimeError(f"Junction road {current_lane.parent_road.id} had "
                                    f"zero or more than one predecessor road.")
 
+        # A single connection is always a valid target, so short-circuit before the
+        #  roundabout check, which walks the junction graph for each candidate.
+        single_connection = connecting_lanes is not None and len(connecting_lanes) == 1
         for connecting_lane in connecting_lanes:
-            if not scenario_map.road_in_roundabout(connecting_lane.parent_road) or len(connecting_lanes) == 1:
-                targets.append(np.array(connecting_lane.midline.coords[-1]))
+            if single_connection or not scenario_map.road_in_roundabout(connecting_lane.parent_road):
+                possible_args.append({"turn_target": np.array(connecting_lane.midline.coords[-1])})
 
-        return [{"turn_target": t} for t in targets]
+        return possible_args
 
 
 class StopMA(MacroAction):
@@ -772,6 +782,8 @@ class StopMA(MacroAction):
 class MacroActionFactory:
     """ Used to register and create macro actions. """
 
+    POSSIBLE_ARGS_CACHE_SIZE = 4096  # Maximum number of memoized get_possible_args queries
+
     macro_action_types = {
         "Continue": Continue,
         "ChangeLaneLeft": ChangeLaneLeft,
@@ -780,6 +792,8 @@ class MacroActionFactory:
         "Stop": StopMA
     }
 
+    _possible_args_cache = {}
+
     @classmethod
     def create(cls, config: MacroActionConfig, agent_id: int, frame: Dict[int, AgentState], scenario_map: Map) \
             -> MacroAction:
@@ -796,7 +810,7 @@ class MacroActionFactory:
         return cls.macro_action_types[config.type](config, agent_id, frame, scenario_map)
 
     @classmethod
-    def register_new_macro(cls, type_str: str, type_macro: type(MacroAction)):
+    def register_new_macro(cls, type_str: str, type_macro: Type[MacroAction]):
         """ Register a new macro action to the list of available maneuvers
 
         Args:
@@ -838,3 +852,37 @@ class MacroActionFactory:
             if macro_action not in actions and macro_action.applicable(agent_state, scenario_map):
                 actions.append(macro_action)
         return actions
+
+    @classmethod
+    def cached_possible_args(cls, macro_action: Type["MacroAction"], agent_state: AgentState,
+                             scenario_map: Map, goal: Goal = None) -> List[Dict]:
+        """ Memoized wrapper around MacroAction.get_possible_args.
+
+        The possible arguments of a macro action are a deterministic function of the agent state,
+        road layout and goal, and the same query recurs many times across MCTS rollouts. Results
+        are therefore reused from a bounded cache, with positions quantized to 0.5 m and headings
+        to roughly 5 degrees so that nearby states share an entry.
+
+        Args:
+            macro_action: The macro action type to query
+            agent_state: Current state of the examined agent
+            scenario_map: The road layout of the scenario
+            goal: Optional goal of the agent
+
+        Returns:
+            A list of keyword argument dictionaries as given by get_possible_args
+        """
+        key = (macro_action.__name__,
+               round(agent_state.position[0] * 2) / 2,
+               round(agent_state.position[1] * 2) / 2,
+               round(agent_state.heading * 12) / 12,
+               round(agent_state.speed, 1),
+               id(scenario_map),
+               type(goal).__name__ if goal is not None else None,
+               tuple(np.round(goal.center, 1)) if goal is not None else None)
+
+        if key not in cls._possible_args_cache:
+            if len(cls._possible_args_cache) >= cls.POSSIBLE_ARGS_CACHE_SIZE:
+                cls._possible_args_cache.clear()
+            cls._possible_args_cache[key] = macro_action.get_possible_args(agent_state, scenario_map, goal)
+        return [args.copy() for args in cls._possible_args_cache[key]]
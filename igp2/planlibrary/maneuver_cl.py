@@ -1,7 +1,8 @@
 import abc
 import numpy as np
 import logging
-from typing import Dict
+from typing import Dict, Type
+from scipy.spatial import cKDTree
 from shapely.geometry import LineString, Point
 
 from igp2.planlibrary.maneuver import Maneuver, ManeuverConfig, FollowLane, Turn, \
@@ -60,16 +61,29 @@ class WaypointManeuver(ClosedLoopManeuver, abc.ABC):
         super().__init__(config, agent_id, frame, scenario_map)
         self._controller = PIDController(1 / self.config.fps, self.LATERAL_ARGS, self.LONGITUDINAL_ARGS)
         self._acc = AdaptiveCruiseControl(1 / self.config.fps, **self.ACC_ARGS)
+        self._trajectory_ls = None
+        self._path_kdtree = None
 
     def get_target_waypoint(self, state: AgentState):
         """ Get the index of the target waypoint in the reference trajectory"""
-        dist = np.linalg.norm(self.trajectory.path - state.position, axis=1)
-        closest_idx = np.argmin(dist)
-        if dist[-1] < self.WAYPOINT_MARGIN:
-            target_wp_idx = len(self.trajectory.path) - 1
+        path = self.trajectory.path
+        # The reference path is fixed for the lifetime of the maneuver, so a KD-tree built
+        #  once replaces the per-tick O(n) distance scan over the whole path with
+        #  O(log n) nearest-neighbour queries.
+        if self._path_kdtree is None:
+            self._path_kdtree = cKDTree(path)
+        closest_idx = self._path_kdtree.query(state.position)[1]
+        if np.linalg.norm(path[-1] - state.position) < self.WAYPOINT_MARGIN:
+            target_wp_idx = len(path) - 1
         else:
-            far_waypoints_dist = dist[closest_idx:]
-            target_wp_idx = closest_idx + np.argmax(far_waypoints_dist >= self.WAYPOINT_MARGIN)
+            # Advance to the first waypoint at least WAYPOINT_MARGIN away from the vehicle,
+            #  falling back to the closest waypoint if no such waypoint remains.
+            within_margin = set(self._path_kdtree.query_ball_point(state.position, self.WAYPOINT_MARGIN))
+            target_wp_idx = closest_idx
+            while target_wp_idx in within_margin:
+                target_wp_idx += 1
+            if target_wp_idx >= len(path):
+                target_wp_idx = closest_idx
         return target_wp_idx, closest_idx
 
     def next_action(self, observation: Observation) -> Action:
@@ -110,7 +124,11 @@ class WaypointManeuver(ClosedLoopManeuver, abc.ABC):
 
     def done(self, observation: Observation) -> bool:
         state = observation.frame[self.agent_id]
-        ls = LineString(self.trajectory.path)
+        # The reference trajectory is fixed for the lifetime of the maneuver, so the
+        #  LineString only needs to be built once rather than on every tick.
+        if self._trajectory_ls is None:
+            self._trajectory_ls = LineString(self.trajectory.path)
+        ls = self._trajectory_ls
         p = Point(state.position)
         dist_along = ls.project(p)
         dist_from_end = np.linalg.norm(state.position - self.trajectory.path[-1])
@@ -231,7 +249,7 @@ class CLManeuverFactory:
         return cls.maneuver_types[config.type](config, agent_id, frame, scenario_map)
 
     @classmethod
-    def register_new_maneuver(cls, type_str: str, type_man: type(ClosedLoopManeuver)):
+    def register_new_maneuver(cls, type_str: str, type_man: Type[ClosedLoopManeuver]):
         """ Register a new closed-loop maneuver to the list of available maneuvers
 
         Args:
@@ -1,6 +1,6 @@
 from .mcts import MCTS
 from .node import Node
 from .reward import Reward
-from .policy import Policy, MaxPolicy, UCB1
+from .policy import Policy, MaxPolicy, UCB1, BatchedUCB1
 from .tree import Tree
 from .mctsaction import MCTSAction
@@ -1,8 +1,12 @@
 import igp2 as ip
 import copy
+import os
 import traceback
 import logging
-from typing import List, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Type
+
+import numpy as np
 
 from igp2.planning.tree import Tree
 from igp2.planning.rollout import Rollout
@@ -10,10 +14,19 @@ from igp2.planning.node import Node
 from igp2.planning.mctsaction import MCTSAction
 from igp2.planning.reward import Reward
 from igp2.core.util import copy_agents_dict
+from igp2.planlibrary.macro_action import MacroActionFactory
 
 logger = logging.getLogger(__name__)
 
 
+def _leaf_rollout(args) -> tuple:
+    """ Run a single leaf rollout in a worker process and return its outcome. """
+    simulator, start_frame = args
+    _, _, goal_reached, alive, collisions = simulator.run(start_frame)
+    ego_trajectory = simulator.agents[simulator.ego_id].trajectory_cl
+    return goal_reached, alive, collisions, ego_trajectory
+
+
 class MCTS:
     """ Class implementing single-threaded MCTS search over environment states with macro actions. """
 
@@ -26,9 +39,9 @@ class MCTS:
                  trajectory_agents: bool = True,
                  fps: int = 10,
                  store_results: str = None,
-                 tree_type: type(Tree) = None,
-                 node_type: type(Node) = None,
-                 action_type: type(MCTSAction) = None):
+                 tree_type: Type[Tree] = None,
+                 node_type: Type[Node] = None,
+                 action_type: Type[MCTSAction] = None):
         """ Initialise a new MCTS planner over states and macro-actions.
 
         Args:
@@ -145,6 +158,61 @@ class MCTS:
 
         return final_plan
 
+    def rollout_batch(self,
+                      simulator: Rollout,
+                      predictions: Dict[int, ip.GoalsProbabilities],
+                      goal: ip.Goal,
+                      start_frame: Dict[int, ip.AgentState],
+                      n: int,
+                      max_workers: int = None) -> float:
+        """ Evaluate the current macro action of the ego with n leaf-parallel rollouts.
+
+        Implements leaf parallelisation: the ego plan already set on the simulator is rolled out
+        n times in worker processes, each time under independently sampled non-ego trajectories,
+        and the rewards of the terminal rollouts are averaged. This reduces the variance of a
+        single-rollout estimate before back-propagation at the cost of extra simulations.
+
+        Args:
+            simulator: Rollout simulator with the macro action of the ego already set.
+            predictions: Goal and trajectory predictions for the non-ego agents.
+            goal: Goal of the ego agent.
+            start_frame: The state of the environment to roll out from.
+            n: The number of parallel rollouts to run.
+            max_workers: Maximum number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            The mean reward of the terminal rollouts, or None if no rollout terminated.
+        """
+        tasks = []
+        for _ in range(n):
+            sim_copy = copy.deepcopy(simulator)
+            for aid in sim_copy.agents:
+                if aid == sim_copy.ego_id:
+                    continue
+                agent_goal = predictions[aid].sample_goals()[0]
+                trajectory, plan = predictions[aid].sample_trajectories_to_goal(agent_goal)
+                if trajectory is not None:
+                    trajectory, plan = trajectory[0], plan[0]
+                sim_copy.update_trajectory(aid, trajectory, plan)
+            tasks.append((sim_copy, start_frame))
+
+        if max_workers is None:
+            max_workers = os.cpu_count()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_leaf_rollout, tasks))
+
+        rewards = []
+        for goal_reached, alive, collisions, ego_trajectory in results:
+            reward = copy.deepcopy(self.reward)
+            reward.reset()
+            r = reward(collisions=collisions,
+                       alive=alive,
+                       ego_trajectory=ego_trajectory if goal_reached else None,
+                       goal=goal)
+            if r is not None:
+                rewards.append(r)
+        return float(np.mean(rewards)) if rewards else None
+
     def _run_simulation(self, agent_id: int, goal: ip.Goal, tree: Tree, simulator: Rollout, debug: bool) -> tuple:
         depth = 0
         node = tree.root
@@ -228,8 +296,9 @@ class MCTS:
             goal: Goal of the agent with agent_id
         """
         actions = []
-        for macro_action in ip.MacroActionFactory.get_applicable_actions(frame[agent_id], self.scenario_map):
-            for ma_args in macro_action.get_possible_args(frame[agent_id], self.scenario_map, goal):
+        for macro_action in MacroActionFactory.get_applicable_actions(frame[agent_id], self.scenario_map):
+            for ma_args in MacroActionFactory.cached_possible_args(
+                    macro_action, frame[agent_id], self.scenario_map, goal):
                 actions.append(self.action_type(macro_action, ma_args))
 
         node = self.node_type(key, frame, actions)
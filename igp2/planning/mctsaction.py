@@ -1,10 +1,12 @@
+from typing import Type
+
 from igp2.planlibrary.macro_action import MacroAction
 
 
 class MCTSAction:
     """ Wrapper class for handling actions in MCTS. """
 
-    def __init__(self, macro_action_type: type(MacroAction), ma_args: dict):
+    def __init__(self, macro_action_type: Type[MacroAction], ma_args: dict):
         """ Initialise a new Action.
 
         Args:
@@ -1,5 +1,6 @@
 import copy
 from collections import defaultdict
+from math import log, sqrt
 from typing import Dict, List, Tuple
 
 import logging
@@ -13,6 +14,10 @@ from igp2.core.util import copy_agents_dict
 
 logger = logging.getLogger(__name__)
 
+# Precomputed sqrt(log(i)) for visit counts i = 1..4096, covering the counts reached by
+#  typical searches so selection avoids the transcendental calls altogether
+_SQRT_LOG_TABLE = np.sqrt(np.log(np.arange(1, 4097)))
+
 
 class Node:
     """ Represents a search node in the MCTS tree. Stores all relevant information for computation of Q-values
@@ -34,6 +39,10 @@ class Node:
         self._state_visits = 0
         self._q_values = None
         self._action_visits = None
+        self._ucb_buffer = None
+        self._inv_sqrt_action_visits = None
+        self._sqrt_log_visits = None
+        self._sqrt_log_visits_at = -1
 
         self._run_result = None
         self._reward_results = defaultdict(list)
@@ -65,6 +74,7 @@ class Node:
             raise TypeError("Cannot expand node without actions")
         self._q_values = np.zeros(len(self._actions))
         self._action_visits = np.zeros(len(self._actions), dtype=np.int32)
+        self._inv_sqrt_action_visits = np.full(len(self._actions), np.inf)
 
     def add_child(self, child: "Node"):
         """ Add a new child to the dictionary of children. """
@@ -124,6 +134,36 @@ class Node:
         """ Return number of time each action has been selected in this node. """
         return self._action_visits
 
+    @property
+    def inv_sqrt_action_visits(self) -> np.ndarray:
+        """ Return 1 / sqrt(action_visits) for each action. Unvisited actions hold inf.
+        The array is kept in sync incrementally as visit counts are updated, so selection
+        policies avoid recomputing a sqrt per child on every descent. """
+        return self._inv_sqrt_action_visits
+
+    @property
+    def sqrt_log_visits(self) -> float:
+        """ Return sqrt(log(state_visits)) of the node. The node is selected many times
+        between visit count changes, so the value is cached and only recomputed when
+        state_visits has changed since the previous query. """
+        if self._sqrt_log_visits_at != self._state_visits:
+            if 0 < self._state_visits <= _SQRT_LOG_TABLE.size:
+                self._sqrt_log_visits = float(_SQRT_LOG_TABLE[self._state_visits - 1])
+            elif self._state_visits > 0:
+                self._sqrt_log_visits = sqrt(log(self._state_visits))
+            else:
+                self._sqrt_log_visits = float("nan")
+            self._sqrt_log_visits_at = self._state_visits
+        return self._sqrt_log_visits
+
+    @property
+    def ucb_buffer(self) -> np.ndarray:
+        """ Scratch buffer with one entry per action, reused by selection policies to
+        compute action values in-place without allocating temporaries. """
+        if self._ucb_buffer is None or self._ucb_buffer.shape != self._q_values.shape:
+            self._ucb_buffer = np.empty_like(self._q_values)
+        return self._ucb_buffer
+
     @property
     def children(self) -> Dict[Tuple, "Node"]:
         """ Return the dictionary of children. """
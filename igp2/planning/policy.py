@@ -1,5 +1,5 @@
 import abc
-from typing import Any, Tuple
+from typing import Any, List, Tuple
 
 import numpy as np
 from math import sqrt
@@ -23,7 +23,9 @@ class MaxPolicy(Policy):
     """ Policy selecting the action with highest Q-value at a node. """
 
     def select(self, node: Node):
-        idx = np.argmax(node.q_values)
+        # The bound ndarray method skips the np.argmax dispatch overhead, which is
+        #  noticeable at the small branching factors typical of MCTS nodes
+        idx = int(node.q_values.argmax())
         return node.actions[idx], idx
 
 
@@ -40,7 +42,45 @@ class UCB1(Policy):
         self.c = c
 
     def select(self, node: Node):
-        with np.errstate(divide="ignore"):
-            values = node.q_values + self.c * np.sqrt(np.log(node.state_visits) / node.action_visits)
-            idx = np.argmax(values)
-            return node.actions[idx], idx
+        # sqrt(log(state_visits)) is cached on the node and 1/sqrt(action_visits) is kept
+        #  in sync incrementally, so selection is a fused multiply-add on the scratch buffer
+        buf = node.ucb_buffer
+        with np.errstate(invalid="ignore"):
+            np.multiply(node.inv_sqrt_action_visits, self.c * node.sqrt_log_visits, out=buf)
+            buf += node.q_values
+        idx = int(buf.argmax())
+        return node.actions[idx], idx
+
+
+class BatchedUCB1(UCB1):
+    """ UCB1 policy that additionally supports selecting actions for a batch of nodes in
+    one vectorised computation, for search variants that expand several nodes per
+    iteration. """
+
+    def select_many(self, nodes: List[Node]) -> List[Tuple[Any, int]]:
+        """ Select an action in each of the given nodes at once.
+
+        Args:
+            nodes: Batch of expanded nodes to select actions in
+
+        Returns:
+            List of the action and its index in the list of actions for each node
+        """
+        batch = len(nodes)
+        width = max(len(node.actions) for node in nodes)
+
+        # Pack the per-node statistics into padded 2D arrays so the UCB values for the
+        #  whole batch come from a single NumPy expression
+        q_values = np.full((batch, width), -np.inf)
+        exploration = np.zeros((batch, width))
+        sqrt_log_visits = np.empty(batch)
+        for i, node in enumerate(nodes):
+            k = len(node.actions)
+            q_values[i, :k] = node.q_values
+            exploration[i, :k] = node.inv_sqrt_action_visits
+            sqrt_log_visits[i] = node.sqrt_log_visits
+
+        with np.errstate(invalid="ignore"):
+            values = q_values + (self.c * sqrt_log_visits)[:, None] * exploration
+        idxs = values.argmax(axis=1)
+        return [(node.actions[idx], int(idx)) for node, idx in zip(nodes, idxs)]
@@ -1,4 +1,6 @@
 import logging
+from math import sqrt
+
 import numpy as np
 from typing import Dict, Optional, List, Tuple
 
@@ -68,6 +70,7 @@ class Tree:
         """ Select one of the actions in the node using the specified policy and update node statistics """
         action, idx = self._action_policy.select(node)
         node.action_visits[idx] += 1
+        node.inv_sqrt_action_visits[idx] = 1.0 / sqrt(node.action_visits[idx])
         return action
 
     def select_plan(self) -> List:
@@ -99,7 +102,7 @@ class Tree:
             action_visit = node.action_visits[idx]
 
             # Eq. 8 - back-propagation rule
-            q = r if child is None else np.max(child.q_values)
+            q = r if child is None else child.q_values.max()
             node.q_values[idx] += (q - node.q_values[idx]) / action_visit
             node.store_q_values()
 
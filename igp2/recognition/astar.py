@@ -73,6 +73,7 @@ class AStar:
         solutions = []
         frontier = [(0.0, ([], frame))]
         iterations = 0
+        goal_is_stopping = isinstance(goal, StoppingGoal)  # Hoisted out of the frontier loop
         while frontier and len(solutions) < n_trajectories and iterations < self.max_iter:
             iterations += 1
             cost, (actions, frame) = heapq.heappop(frontier)
@@ -80,7 +81,7 @@ class AStar:
             # Check termination condition
             trajectory = self._full_trajectory(actions, offset_point=False)
             if self.goal_reached(goal, trajectory) and \
-                    (not isinstance(goal, StoppingGoal) or
+                    (not goal_is_stopping or
                      trajectory.duration >= StopMA.DEFAULT_STOP_DURATION):
                 if not actions:
                     logger.info(f"AID {agent_id} at {goal} already.")